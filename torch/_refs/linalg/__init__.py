@@ -153,6 +153,16 @@ def vector_norm(
         is_ord_even = ord % 2 == 0 if isinstance(ord, IntLike) else ord % 2.0 == 0.0
         if not (is_ord_even and utils.is_float_dtype(x.dtype)):
             x = torch.abs(x)
+        # Specialize small integer orders to repeated multiplication; pow is
+        # noticeably slower than mul for these common cases
+        if ord == 1.0:
+            return to_result_dtype(reduce_sum(x))  # type: ignore[return-value]
+        elif ord == 2.0:
+            return to_result_dtype(torch.sqrt(reduce_sum(x * x)))  # type: ignore[return-value]
+        elif ord == 3.0:
+            return to_result_dtype(
+                torch.pow(reduce_sum(x * x * x), 1.0 / 3.0)
+            )  # type: ignore[return-value]
         return to_result_dtype(torch.pow(reduce_sum(torch.pow(x, ord)), 1.0 / ord))  # type: ignore[return-value]
 
 
@@ -4595,12 +4595,14 @@ Tensor fft_r2c_backward(
 
 // Helper for batchnorm_double_backward
 static Tensor sum_exclude_dim1(const Tensor& to_sum, bool keepdim = true) {
-  auto r = to_sum.sum(0, keepdim);
-  int64_t start_point_exclusive = keepdim ? 1 : 0;
-  for (int64_t dim = r.dim() - 1; dim > start_point_exclusive; dim--) {
-    r = r.sum(dim, keepdim);
+  c10::DimVector dims;
+  dims.reserve(to_sum.dim() - 1);
+  for (const auto d : c10::irange(to_sum.dim())) {
+    if (d != 1) {
+      dims.push_back(d);
+    }
   }
-  return r;
+  return to_sum.sum(dims, keepdim);
 }
 
 // Helper for batchnorm_double_backward
@@ -4643,6 +4645,15 @@ std::tuple<Tensor, Tensor, Tensor> batchnorm_double_backward(
     const std::optional<Tensor>& save_invstd,
     std::array<bool, 3> output_mask) {
   bool affine = isDefined(gamma);
+  if (!ggI.defined() && !ggG.defined() && !ggB.defined()) {
+    // every output is a sum of terms gated on one of the incoming grads, so
+    // with no incoming grads there is nothing to compute
+    if (output_mask[1]) {
+      TORCH_INTERNAL_ASSERT(
+          affine, "gamma should always be defined when it requires grad");
+    }
+    return std::tuple<Tensor, Tensor, Tensor>{Tensor(), Tensor(), Tensor()};
+  }
   // TODO: Do we have a ScalarOrTensor type?  Would such a thing exist?
   Tensor gamma_expanded;
   Tensor ggG_expanded, ggB_expanded;
@@ -4705,8 +4716,7 @@ std::tuple<Tensor, Tensor, Tensor> batchnorm_double_backward(
     if (training) {
       auto t0 = gO * sigma2_eps_neg_1_2;
       auto t1 = (sigma2_eps_neg_1_2 * gO_sum).div_(-M);
-      auto t2 = (input_mu_sigma2_neg_3_2 * sum_exclude_dim1(gO * input_sub_mu))
-                    .div_(-M);
+      auto t2 = (input_mu_sigma2_neg_3_2 * gOinmu_sum).div_(-M);
       gI_G_term = ggG_expanded * (t0.add_(t1).add_(t2));
       gI = gI.defined() ? gI.add_(gI_G_term) : gI_G_term;
     } else {
@@ -4715,15 +4725,19 @@ std::tuple<Tensor, Tensor, Tensor> batchnorm_double_backward(
     }
   }
 
-  // this is the first backward's grad_input
+  // this is the first backward's grad_input; input_mu_sigma2_neg_1 does not
+  // depend on the arguments, so it is computed lazily once and shared between
+  // the gG and ggO invocations below
+  Tensor input_mu_sigma2_neg_1;
   auto first_back_grad_input = [&](const Tensor& gO,
                                    const Tensor& gamma) -> Tensor {
     auto h0 = (gamma * sigma2_eps_neg_1_2).div_(M);
+    if (!input_mu_sigma2_neg_1.defined()) {
+      input_mu_sigma2_neg_1 = input_sub_mu.mul(sigma2_eps_neg_1);
+    }
     auto h1 = (M * gO)
                   .sub_(sum_exclude_dim1(gO))
-                  .sub_(
-                      input_sub_mu.mul(sigma2_eps_neg_1) *
-                      sum_exclude_dim1(gO * input_sub_mu));
+                  .sub_(input_mu_sigma2_neg_1 * sum_exclude_dim1(gO * input_sub_mu));
     return h0 * h1;
   };
 
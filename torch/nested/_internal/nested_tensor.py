@@ -422,19 +422,22 @@ def jagged_from_list(
 
     if len(tensors) == 0:
         raise RuntimeError("Cannot construct a nested tensor from an empty tensor list")
-    if not len(set(t.dtype for t in tensors)) == 1:  # noqa: C401
+    # Validate dtype / device / dim consistency in a single pass over the list
+    # instead of building a throwaway set per property.
+    first = tensors[0]
+    if any(t.dtype != first.dtype for t in tensors):
         raise RuntimeError(
             "When constructing a nested tensor, all tensors in list must have the same dtype"
         )
-    if not len(set(t.device for t in tensors)) == 1:  # noqa: C401
+    if any(t.device != first.device for t in tensors):
         raise RuntimeError(
             "When constructing a nested tensor, all tensors in list must be on the same device"
         )
-    if not len(set(t.dim() for t in tensors)) == 1:  # noqa: C401
+    if any(t.dim() != first.dim() for t in tensors):
         raise RuntimeError(
             "When constructing a nested tensor, all tensors in list must have the same dim"
         )
-    component_dim = tensors[0].dim()
+    component_dim = first.dim()
     if component_dim == 0:
         raise RuntimeError(
             "Cannot construct a nested tensor from a list of zero-dim tensors"
@@ -463,13 +466,24 @@ def jagged_from_list(
         ragged_idx = 1
 
     # Set properties appropriately.
-    values = torch.cat(tensors, dim=(ragged_idx - 1))
-    to_kwargs = {}
-    if device is not None:
-        to_kwargs["device"] = device
-    if dtype is not None:
-        to_kwargs["dtype"] = dtype
-    values = values.to(**to_kwargs)
+    cat_dim = ragged_idx - 1
+    out_device = first.device if device is None else torch.device(device)
+    out_dtype = first.dtype if dtype is None else dtype
+    if out_device == first.device and out_dtype == first.dtype:
+        values = torch.cat(tensors, dim=cat_dim)
+    else:
+        # cat would allocate a buffer in the source dtype / device and to()
+        # would allocate a second full-size buffer for the conversion.
+        # Allocate the converted buffer once and cast while copying each
+        # component into it.
+        values_shape = list(sizes[0])
+        values_shape[cat_dim] = sum(s[cat_dim] for s in sizes)
+        values = first.new_empty(values_shape, dtype=out_dtype, device=out_device)
+        offset = 0
+        for t in tensors:
+            length = t.shape[cat_dim]
+            values.narrow(cat_dim, offset, length).copy_(t)
+            offset += length
 
     # Calculate jagged offsets if not provided.
     if offsets is None:
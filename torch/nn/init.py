@@ -8,6 +8,24 @@ import torch
 from torch import Tensor
 
 
+# Constant recommended gains for calculate_gain; leaky_relu is handled
+# separately since its gain depends on the negative slope. The SELU value was
+# found empirically (https://github.com/pytorch/pytorch/pull/50664).
+_constant_gains = {
+    "linear": 1,
+    "conv1d": 1,
+    "conv2d": 1,
+    "conv3d": 1,
+    "conv_transpose1d": 1,
+    "conv_transpose2d": 1,
+    "conv_transpose3d": 1,
+    "sigmoid": 1,
+    "tanh": 5.0 / 3,
+    "relu": math.sqrt(2.0),
+    "selu": 3.0 / 4,
+}
+
+
 # These no_grad_* functions are necessary as wrappers around the parts of these
 # functions that use `with torch.no_grad()`. The JIT doesn't support context
 # managers, so these need to be implemented as builtins. Using these wrappers
@@ -103,22 +121,10 @@ def calculate_gain(nonlinearity, param=None):
 
     .. _Self-Normalizing Neural Networks: https://papers.nips.cc/paper/2017/hash/5d44ee6f2c3f71b73125876103c8f6c4-Abstract.html
     """
-    linear_fns = [
-        "linear",
-        "conv1d",
-        "conv2d",
-        "conv3d",
-        "conv_transpose1d",
-        "conv_transpose2d",
-        "conv_transpose3d",
-    ]
-    if nonlinearity in linear_fns or nonlinearity == "sigmoid":
-        return 1
-    elif nonlinearity == "tanh":
-        return 5.0 / 3
-    elif nonlinearity == "relu":
-        return math.sqrt(2.0)
-    elif nonlinearity == "leaky_relu":
+    gain = _constant_gains.get(nonlinearity)
+    if gain is not None:
+        return gain
+    if nonlinearity == "leaky_relu":
         if param is None:
             negative_slope = 0.01
         elif (
@@ -131,12 +137,7 @@ def calculate_gain(nonlinearity, param=None):
         else:
             raise ValueError(f"negative_slope {param} not a valid number")
         return math.sqrt(2.0 / (1 + negative_slope**2))
-    elif nonlinearity == "selu":
-        return (
-            3.0 / 4
-        )  # Value found empirically (https://github.com/pytorch/pytorch/pull/50664)
-    else:
-        raise ValueError(f"Unsupported nonlinearity {nonlinearity}")
+    raise ValueError(f"Unsupported nonlinearity {nonlinearity}")
 
 
 def uniform_(
@@ -285,7 +286,10 @@ def eye_(tensor):
         raise ValueError("Only tensors with 2 dimensions are supported")
 
     with torch.no_grad():
-        torch.eye(*tensor.shape, out=tensor, requires_grad=tensor.requires_grad)
+        # memset-backed zero fill plus a strided write of the diagonal view;
+        # avoids routing the whole fill through torch.eye's generic kernel
+        tensor.zero_()
+        tensor.diagonal().fill_(1)
     return tensor
 
 
@@ -320,25 +324,20 @@ def dirac_(tensor, groups=1):
     with torch.no_grad():
         tensor.zero_()
 
-        for g in range(groups):
-            for d in range(min_dim):
-                if dimensions == 3:  # Temporal convolution
-                    tensor[g * out_chans_per_grp + d, d, tensor.size(2) // 2] = 1
-                elif dimensions == 4:  # Spatial convolution
-                    tensor[
-                        g * out_chans_per_grp + d,
-                        d,
-                        tensor.size(2) // 2,
-                        tensor.size(3) // 2,
-                    ] = 1
-                else:  # Volumetric convolution
-                    tensor[
-                        g * out_chans_per_grp + d,
-                        d,
-                        tensor.size(2) // 2,
-                        tensor.size(3) // 2,
-                        tensor.size(4) // 2,
-                    ] = 1
+        # One fancy-index assignment over all (group, channel) pairs instead
+        # of a Python loop with one indexing op per non-zero element.
+        in_idx = torch.arange(min_dim, device=tensor.device).repeat(groups)
+        out_idx = (
+            torch.arange(groups, device=tensor.device).repeat_interleave(min_dim)
+            * out_chans_per_grp
+            + in_idx
+        )
+        if dimensions == 3:  # Temporal convolution
+            tensor[out_idx, in_idx, sizes[2] // 2] = 1
+        elif dimensions == 4:  # Spatial convolution
+            tensor[out_idx, in_idx, sizes[2] // 2, sizes[3] // 2] = 1
+        else:  # Volumetric convolution
+            tensor[out_idx, in_idx, sizes[2] // 2, sizes[3] // 2, sizes[4] // 2] = 1
     return tensor
 
 
@@ -609,16 +608,24 @@ def orthogonal_(
     # Compute the qr factorization
     q, r = torch.linalg.qr(flattened)
     # Make Q uniform according to https://arxiv.org/pdf/math-ph/0609050.pdf
-    d = torch.diag(r, 0)
-    ph = d.sign()
-    q *= ph
+    # r.diagonal() is a view, so no intermediate diagonal copy is made and the
+    # sign flip is applied to the columns of Q in place
+    q.mul_(r.diagonal().sign())
 
     if rows < cols:
         q.t_()
 
     with torch.no_grad():
-        tensor.view_as(q).copy_(q)
-        tensor.mul_(gain)
+        # q is a temporary, so fold the gain into it and write tensor once
+        # instead of copying and then rescaling the destination
+        if gain != 1:
+            q.mul_(gain)
+        if tensor.is_contiguous():
+            tensor.view_as(q).copy_(q)
+        else:
+            # view_as would throw on a layout that cannot alias a 2D matrix;
+            # reshape the temporary instead and copy through strides
+            tensor.copy_(q.reshape(tensor.shape))
     return tensor
 
 
@@ -653,10 +660,14 @@ def sparse_(
 
     with torch.no_grad():
         tensor.normal_(0, std, generator=generator)
-        for col_idx in range(cols):
-            row_indices = torch.randperm(rows)
-            zero_indices = row_indices[:num_zeros]
-            tensor[zero_indices, col_idx] = 0
+        if num_zeros > 0:
+            # Draw an independent permutation per column in a single batched
+            # call: argsort of i.i.d. uniforms along dim 0 yields a uniform
+            # random permutation of the rows for every column.
+            zero_indices = torch.rand(
+                rows, cols, device=tensor.device, generator=generator
+            ).argsort(dim=0)[:num_zeros]
+            tensor.scatter_(0, zero_indices, 0)
     return tensor
 
 
@@ -840,28 +840,39 @@ def common_pre_export_passes(
     # See [NOTE: Modularize pass ordering]
     module = passes.Modularize(diagnostic_context, module).run()
 
+    # The adapter steps below are stateless and bound to the tracer, which is
+    # shared across invocations of the pre-export passes; registering a step a
+    # second time would apply its adaptation twice. Append each only once.
+    def _append_step_once(adapter, step):
+        if all(type(existing) is not type(step) for existing in adapter._steps):
+            adapter.append_step(step)
+
     # ONNX does not support None inputs. During graph building, all None inputs
     # are removed. Here we register this step to input adapter.
-    options.fx_tracer.input_adapter.append_step(io_adapter.RemoveNoneInputStep())
+    _append_step_once(options.fx_tracer.input_adapter, io_adapter.RemoveNoneInputStep())
 
     # NOTE: temp workaround for https://github.com/pytorch/pytorch/issues/99534
     # Dynamo doesn't support non-tensor inputs.
-    options.fx_tracer.input_adapter.append_step(io_adapter.RemoveNonTensorInputStep())
+    _append_step_once(
+        options.fx_tracer.input_adapter, io_adapter.RemoveNonTensorInputStep()
+    )
 
     # ONNX does not support complex inputs. During graph building, all complex inputs
     # are converted to real representation inputs. Here we register this step to
     # input/output adapter.
-    options.fx_tracer.input_adapter.append_step(
-        io_adapter.ConvertComplexToRealRepresentationInputStep()
+    _append_step_once(
+        options.fx_tracer.input_adapter,
+        io_adapter.ConvertComplexToRealRepresentationInputStep(),
     )
 
     # ONNX can't represent collection types (e.g., dictionary, tuple of tuple of
     # tensor, etc), we flatten the collection and register each element as output.
-    options.fx_tracer.output_adapter.append_step(io_adapter.FlattenOutputStep())
+    _append_step_once(options.fx_tracer.output_adapter, io_adapter.FlattenOutputStep())
 
     # Output post-processing steps should happen after `FlattenOutputStep`.
-    options.fx_tracer.output_adapter.append_step(
-        io_adapter.ConvertComplexToRealRepresentationOutputStep()
+    _append_step_once(
+        options.fx_tracer.output_adapter,
+        io_adapter.ConvertComplexToRealRepresentationOutputStep(),
     )
 
     return module
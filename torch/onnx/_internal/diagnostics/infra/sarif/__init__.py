@@ -1,101 +1,181 @@
 # DO NOT EDIT! This file was generated by jschema_to_python version 0.0.1.dev29,
 # with extension for dataclasses and type annotation.
+# The lazy submodule loading below is maintained by hand; regenerate the class
+# list with the schema tooling and keep __getattr__ in sync.
 
-from torch.onnx._internal.diagnostics.infra.sarif._address import Address
-from torch.onnx._internal.diagnostics.infra.sarif._artifact import Artifact
-from torch.onnx._internal.diagnostics.infra.sarif._artifact_change import ArtifactChange
-from torch.onnx._internal.diagnostics.infra.sarif._artifact_content import (
-    ArtifactContent,
-)
-from torch.onnx._internal.diagnostics.infra.sarif._artifact_location import (
-    ArtifactLocation,
-)
-from torch.onnx._internal.diagnostics.infra.sarif._attachment import Attachment
-from torch.onnx._internal.diagnostics.infra.sarif._code_flow import CodeFlow
-from torch.onnx._internal.diagnostics.infra.sarif._configuration_override import (
-    ConfigurationOverride,
-)
-from torch.onnx._internal.diagnostics.infra.sarif._conversion import Conversion
-from torch.onnx._internal.diagnostics.infra.sarif._edge import Edge
-from torch.onnx._internal.diagnostics.infra.sarif._edge_traversal import EdgeTraversal
-from torch.onnx._internal.diagnostics.infra.sarif._exception import Exception
-from torch.onnx._internal.diagnostics.infra.sarif._external_properties import (
-    ExternalProperties,
-)
-from torch.onnx._internal.diagnostics.infra.sarif._external_property_file_reference import (
-    ExternalPropertyFileReference,
-)
-from torch.onnx._internal.diagnostics.infra.sarif._external_property_file_references import (
-    ExternalPropertyFileReferences,
-)
-from torch.onnx._internal.diagnostics.infra.sarif._fix import Fix
-from torch.onnx._internal.diagnostics.infra.sarif._graph import Graph
-from torch.onnx._internal.diagnostics.infra.sarif._graph_traversal import GraphTraversal
-from torch.onnx._internal.diagnostics.infra.sarif._invocation import Invocation
-from torch.onnx._internal.diagnostics.infra.sarif._location import Location
-from torch.onnx._internal.diagnostics.infra.sarif._location_relationship import (
-    LocationRelationship,
-)
-from torch.onnx._internal.diagnostics.infra.sarif._logical_location import (
-    LogicalLocation,
-)
-from torch.onnx._internal.diagnostics.infra.sarif._message import Message
-from torch.onnx._internal.diagnostics.infra.sarif._multiformat_message_string import (
-    MultiformatMessageString,
-)
-from torch.onnx._internal.diagnostics.infra.sarif._node import Node
-from torch.onnx._internal.diagnostics.infra.sarif._notification import Notification
-from torch.onnx._internal.diagnostics.infra.sarif._physical_location import (
-    PhysicalLocation,
-)
-from torch.onnx._internal.diagnostics.infra.sarif._property_bag import PropertyBag
-from torch.onnx._internal.diagnostics.infra.sarif._rectangle import Rectangle
-from torch.onnx._internal.diagnostics.infra.sarif._region import Region
-from torch.onnx._internal.diagnostics.infra.sarif._replacement import Replacement
-from torch.onnx._internal.diagnostics.infra.sarif._reporting_configuration import (
-    ReportingConfiguration,
-)
-from torch.onnx._internal.diagnostics.infra.sarif._reporting_descriptor import (
-    ReportingDescriptor,
-)
-from torch.onnx._internal.diagnostics.infra.sarif._reporting_descriptor_reference import (
-    ReportingDescriptorReference,
-)
-from torch.onnx._internal.diagnostics.infra.sarif._reporting_descriptor_relationship import (
-    ReportingDescriptorRelationship,
-)
-from torch.onnx._internal.diagnostics.infra.sarif._result import Result
-from torch.onnx._internal.diagnostics.infra.sarif._result_provenance import (
-    ResultProvenance,
-)
-from torch.onnx._internal.diagnostics.infra.sarif._run import Run
-from torch.onnx._internal.diagnostics.infra.sarif._run_automation_details import (
-    RunAutomationDetails,
-)
-from torch.onnx._internal.diagnostics.infra.sarif._sarif_log import SarifLog
-from torch.onnx._internal.diagnostics.infra.sarif._special_locations import (
-    SpecialLocations,
-)
-from torch.onnx._internal.diagnostics.infra.sarif._stack import Stack
-from torch.onnx._internal.diagnostics.infra.sarif._stack_frame import StackFrame
-from torch.onnx._internal.diagnostics.infra.sarif._suppression import Suppression
-from torch.onnx._internal.diagnostics.infra.sarif._thread_flow import ThreadFlow
-from torch.onnx._internal.diagnostics.infra.sarif._thread_flow_location import (
-    ThreadFlowLocation,
-)
-from torch.onnx._internal.diagnostics.infra.sarif._tool import Tool
-from torch.onnx._internal.diagnostics.infra.sarif._tool_component import ToolComponent
-from torch.onnx._internal.diagnostics.infra.sarif._tool_component_reference import (
-    ToolComponentReference,
-)
-from torch.onnx._internal.diagnostics.infra.sarif._translation_metadata import (
-    TranslationMetadata,
-)
-from torch.onnx._internal.diagnostics.infra.sarif._version_control_details import (
-    VersionControlDetails,
-)
-from torch.onnx._internal.diagnostics.infra.sarif._web_request import WebRequest
-from torch.onnx._internal.diagnostics.infra.sarif._web_response import WebResponse
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from torch.onnx._internal.diagnostics.infra.sarif._address import Address
+    from torch.onnx._internal.diagnostics.infra.sarif._artifact import Artifact
+    from torch.onnx._internal.diagnostics.infra.sarif._artifact_change import ArtifactChange
+    from torch.onnx._internal.diagnostics.infra.sarif._artifact_content import (
+        ArtifactContent,
+    )
+    from torch.onnx._internal.diagnostics.infra.sarif._artifact_location import (
+        ArtifactLocation,
+    )
+    from torch.onnx._internal.diagnostics.infra.sarif._attachment import Attachment
+    from torch.onnx._internal.diagnostics.infra.sarif._code_flow import CodeFlow
+    from torch.onnx._internal.diagnostics.infra.sarif._configuration_override import (
+        ConfigurationOverride,
+    )
+    from torch.onnx._internal.diagnostics.infra.sarif._conversion import Conversion
+    from torch.onnx._internal.diagnostics.infra.sarif._edge import Edge
+    from torch.onnx._internal.diagnostics.infra.sarif._edge_traversal import EdgeTraversal
+    from torch.onnx._internal.diagnostics.infra.sarif._exception import Exception
+    from torch.onnx._internal.diagnostics.infra.sarif._external_properties import (
+        ExternalProperties,
+    )
+    from torch.onnx._internal.diagnostics.infra.sarif._external_property_file_reference import (
+        ExternalPropertyFileReference,
+    )
+    from torch.onnx._internal.diagnostics.infra.sarif._external_property_file_references import (
+        ExternalPropertyFileReferences,
+    )
+    from torch.onnx._internal.diagnostics.infra.sarif._fix import Fix
+    from torch.onnx._internal.diagnostics.infra.sarif._graph import Graph
+    from torch.onnx._internal.diagnostics.infra.sarif._graph_traversal import GraphTraversal
+    from torch.onnx._internal.diagnostics.infra.sarif._invocation import Invocation
+    from torch.onnx._internal.diagnostics.infra.sarif._location import Location
+    from torch.onnx._internal.diagnostics.infra.sarif._location_relationship import (
+        LocationRelationship,
+    )
+    from torch.onnx._internal.diagnostics.infra.sarif._logical_location import (
+        LogicalLocation,
+    )
+    from torch.onnx._internal.diagnostics.infra.sarif._message import Message
+    from torch.onnx._internal.diagnostics.infra.sarif._multiformat_message_string import (
+        MultiformatMessageString,
+    )
+    from torch.onnx._internal.diagnostics.infra.sarif._node import Node
+    from torch.onnx._internal.diagnostics.infra.sarif._notification import Notification
+    from torch.onnx._internal.diagnostics.infra.sarif._physical_location import (
+        PhysicalLocation,
+    )
+    from torch.onnx._internal.diagnostics.infra.sarif._property_bag import PropertyBag
+    from torch.onnx._internal.diagnostics.infra.sarif._rectangle import Rectangle
+    from torch.onnx._internal.diagnostics.infra.sarif._region import Region
+    from torch.onnx._internal.diagnostics.infra.sarif._replacement import Replacement
+    from torch.onnx._internal.diagnostics.infra.sarif._reporting_configuration import (
+        ReportingConfiguration,
+    )
+    from torch.onnx._internal.diagnostics.infra.sarif._reporting_descriptor import (
+        ReportingDescriptor,
+    )
+    from torch.onnx._internal.diagnostics.infra.sarif._reporting_descriptor_reference import (
+        ReportingDescriptorReference,
+    )
+    from torch.onnx._internal.diagnostics.infra.sarif._reporting_descriptor_relationship import (
+        ReportingDescriptorRelationship,
+    )
+    from torch.onnx._internal.diagnostics.infra.sarif._result import Result
+    from torch.onnx._internal.diagnostics.infra.sarif._result_provenance import (
+        ResultProvenance,
+    )
+    from torch.onnx._internal.diagnostics.infra.sarif._run import Run
+    from torch.onnx._internal.diagnostics.infra.sarif._run_automation_details import (
+        RunAutomationDetails,
+    )
+    from torch.onnx._internal.diagnostics.infra.sarif._sarif_log import SarifLog
+    from torch.onnx._internal.diagnostics.infra.sarif._special_locations import (
+        SpecialLocations,
+    )
+    from torch.onnx._internal.diagnostics.infra.sarif._stack import Stack
+    from torch.onnx._internal.diagnostics.infra.sarif._stack_frame import StackFrame
+    from torch.onnx._internal.diagnostics.infra.sarif._suppression import Suppression
+    from torch.onnx._internal.diagnostics.infra.sarif._thread_flow import ThreadFlow
+    from torch.onnx._internal.diagnostics.infra.sarif._thread_flow_location import (
+        ThreadFlowLocation,
+    )
+    from torch.onnx._internal.diagnostics.infra.sarif._tool import Tool
+    from torch.onnx._internal.diagnostics.infra.sarif._tool_component import ToolComponent
+    from torch.onnx._internal.diagnostics.infra.sarif._tool_component_reference import (
+        ToolComponentReference,
+    )
+    from torch.onnx._internal.diagnostics.infra.sarif._translation_metadata import (
+        TranslationMetadata,
+    )
+    from torch.onnx._internal.diagnostics.infra.sarif._version_control_details import (
+        VersionControlDetails,
+    )
+    from torch.onnx._internal.diagnostics.infra.sarif._web_request import WebRequest
+    from torch.onnx._internal.diagnostics.infra.sarif._web_response import WebResponse
+
+# Exported class name -> submodule defining it. Submodules are only imported
+# on first attribute access (PEP 562) so that importing this package does not
+# eagerly load ~50 modules of generated dataclasses.
+_CLASS_TO_MODULE = {
+    "Address": "_address",
+    "Artifact": "_artifact",
+    "ArtifactChange": "_artifact_change",
+    "ArtifactContent": "_artifact_content",
+    "ArtifactLocation": "_artifact_location",
+    "Attachment": "_attachment",
+    "CodeFlow": "_code_flow",
+    "ConfigurationOverride": "_configuration_override",
+    "Conversion": "_conversion",
+    "Edge": "_edge",
+    "EdgeTraversal": "_edge_traversal",
+    "Exception": "_exception",
+    "ExternalProperties": "_external_properties",
+    "ExternalPropertyFileReference": "_external_property_file_reference",
+    "ExternalPropertyFileReferences": "_external_property_file_references",
+    "Fix": "_fix",
+    "Graph": "_graph",
+    "GraphTraversal": "_graph_traversal",
+    "Invocation": "_invocation",
+    "Location": "_location",
+    "LocationRelationship": "_location_relationship",
+    "LogicalLocation": "_logical_location",
+    "Message": "_message",
+    "MultiformatMessageString": "_multiformat_message_string",
+    "Node": "_node",
+    "Notification": "_notification",
+    "PhysicalLocation": "_physical_location",
+    "PropertyBag": "_property_bag",
+    "Rectangle": "_rectangle",
+    "Region": "_region",
+    "Replacement": "_replacement",
+    "ReportingConfiguration": "_reporting_configuration",
+    "ReportingDescriptor": "_reporting_descriptor",
+    "ReportingDescriptorReference": "_reporting_descriptor_reference",
+    "ReportingDescriptorRelationship": "_reporting_descriptor_relationship",
+    "Result": "_result",
+    "ResultProvenance": "_result_provenance",
+    "Run": "_run",
+    "RunAutomationDetails": "_run_automation_details",
+    "SarifLog": "_sarif_log",
+    "SpecialLocations": "_special_locations",
+    "Stack": "_stack",
+    "StackFrame": "_stack_frame",
+    "Suppression": "_suppression",
+    "ThreadFlow": "_thread_flow",
+    "ThreadFlowLocation": "_thread_flow_location",
+    "Tool": "_tool",
+    "ToolComponent": "_tool_component",
+    "ToolComponentReference": "_tool_component_reference",
+    "TranslationMetadata": "_translation_metadata",
+    "VersionControlDetails": "_version_control_details",
+    "WebRequest": "_web_request",
+    "WebResponse": "_web_response",
+}
+
+
+def __getattr__(name: str):
+    module_name = _CLASS_TO_MODULE.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    attr = getattr(module, name)
+    # Cache on the package so subsequent accesses skip __getattr__.
+    globals()[name] = attr
+    return attr
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_CLASS_TO_MODULE))
 
 
 # flake8: noqa
@@ -167,7 +167,9 @@ class DynamoExport(_exporter_legacy.FXGraphExtractor):
         aten_graph: bool | None = None,
     ):
         super().__init__()
-        self.aten_graph = aten_graph or True
+        # default to ATen-level export unless the caller explicitly opts out;
+        # the previous `aten_graph or True` silently discarded False
+        self.aten_graph = True if aten_graph is None else aten_graph
 
     def generate_fx(
         self,
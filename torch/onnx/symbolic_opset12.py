@@ -44,6 +44,10 @@ __all__ = [
 
 _onnx_symbolic = functools.partial(registration.onnx_symbolic, opset=12)
 
+# Maps the aten reduction enum (0=none, 1=mean, 2=sum) to the ONNX reduction
+# attribute string; shared by the loss symbolics below.
+_REDUCTION_VALS = ("none", "mean", "sum")
+
 
 def _einsum_helper(g: jit_utils.GraphContext, equation, tensors):
     if not tensors:
@@ -118,8 +122,7 @@ def nll_loss(g: jit_utils.GraphContext, self, target, weight, reduction, ignore_
     # mean reduction : onnx::Constant[value={1}]
     # sum reduction : onnx::Constant[value={2}]
     reduction = symbolic_helper._maybe_get_const(reduction, "i")
-    reduction_vals = ["none", "mean", "sum"]
-    reduction = reduction_vals[reduction]
+    reduction = _REDUCTION_VALS[reduction]
 
     # in onnx NegativeLogLikelihoodLoss specification, ignore_index is optional without default value.
     # therefore we need to set ignore_index attribute even if it is not specified (e.g. ignore_index=-100).
@@ -173,8 +176,7 @@ def cross_entropy_loss(
     # mean reduction : onnx::Constant[value={1}]
     # sum reduction : onnx::Constant[value={2}]
     reduction = symbolic_helper._maybe_get_const(reduction, "i")
-    reduction_vals = ["none", "mean", "sum"]
-    reduction = reduction_vals[reduction]
+    reduction = _REDUCTION_VALS[reduction]
 
     label_smoothing = symbolic_helper._maybe_get_const(label_smoothing, "f")
     if label_smoothing is not None and label_smoothing > 0.0:
@@ -252,10 +252,15 @@ def _single_tensor_asgd(
             param.add_(grad, alpha=-eta_value)  # update parameter
 
         # averaging
-        if capturable or mu.item() != 1:
+        if capturable:
             ax.add_(param.sub(ax).mul_(mu))
         else:
-            ax.copy_(param)
+            mu_value = mu.item()
+            if mu_value != 1:
+                # ax + mu * (param - ax) as one fused kernel with no temporary
+                ax.lerp_(param, mu_value)
+            else:
+                ax.copy_(param)
 
         if capturable:
             eta.copy_(lr / ((1 + lambd * lr * step_t) ** alpha))
@@ -395,14 +400,36 @@ def _multi_tensor_asgd(
             torch._foreach_mul_(new_etas, lr)
             torch._foreach_copy_(grouped_etas, new_etas)
         else:
-            new_etas = [
-                torch.as_tensor(lr / ((1 + lambd * lr * step) ** alpha), device=device)
-                for step in grouped_state_steps
-            ]
-            new_mus = [
-                torch.as_tensor(1 / max(1, _get_value(step) - t0), device=device)
-                for step in grouped_state_steps
-            ]
+            if not torch.compiler.is_compiling():
+                # Step counts within a group are almost always identical, so
+                # memoize the scalar math: N parameters cost one pow and one
+                # tensor wrap per distinct step value instead of N each.
+                eta_for_step: dict = {}
+                mu_for_step: dict = {}
+                new_etas = []
+                new_mus = []
+                for step_t in grouped_state_steps:
+                    step = _get_value(step_t)
+                    if step not in eta_for_step:
+                        eta_for_step[step] = torch.as_tensor(
+                            lr / ((1 + lambd * lr * step) ** alpha), device=device
+                        )
+                        mu_for_step[step] = torch.as_tensor(
+                            1 / max(1, step - t0), device=device
+                        )
+                    new_etas.append(eta_for_step[step])
+                    new_mus.append(mu_for_step[step])
+            else:
+                new_etas = [
+                    torch.as_tensor(
+                        lr / ((1 + lambd * lr * step) ** alpha), device=device
+                    )
+                    for step in grouped_state_steps
+                ]
+                new_mus = [
+                    torch.as_tensor(1 / max(1, _get_value(step) - t0), device=device)
+                    for step in grouped_state_steps
+                ]
             torch._foreach_copy_(grouped_etas, new_etas)
             torch._foreach_copy_(grouped_mus, new_mus)
 
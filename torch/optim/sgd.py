@@ -81,20 +81,24 @@ class SGD(Optimizer):  # noqa: D101
 
     def _init_group(self, group, params, grads, momentum_buffer_list):
         has_sparse_grad = False
+        fused = group["fused"]
+        momentum = group["momentum"]
 
         for p in group["params"]:
-            if p.grad is not None:
-                if group["fused"] and getattr(
+            # p.grad goes through a C++ property binding; read it once.
+            grad = p.grad
+            if grad is not None:
+                if fused and getattr(
                     self, "_need_device_dtype_check_for_fused", True
                 ):
                     _device_dtype_check_for_fused(p)
                     self._need_device_dtype_check_for_fused = False
                 params.append(p)
-                grads.append(p.grad)
-                if p.grad.is_sparse:
+                grads.append(grad)
+                if grad.is_sparse:
                     has_sparse_grad = True
 
-                if group["momentum"] != 0:
+                if momentum != 0:
                     state = self.state[p]
                     momentum_buffer_list.append(state.get("momentum_buffer"))
 
@@ -340,7 +344,8 @@ def _single_tensor_sgd(
             buf = momentum_buffer_list[i]
 
             if buf is None:
-                buf = torch.clone(grad).detach()
+                # detach first so the clone is not recorded by autograd
+                buf = grad.detach().clone()
                 momentum_buffer_list[i] = buf
             else:
                 buf.mul_(momentum).add_(grad, alpha=1 - dampening)
@@ -392,7 +397,22 @@ def _multi_tensor_sgd(
         if maximize:
             device_grads = torch._foreach_neg(device_grads)  # type: ignore[assignment]
 
-        if weight_decay != 0:
+        all_states_with_momentum_buffer = momentum != 0 and all(
+            buf is not None for buf in device_momentum_buffer_list
+        )
+
+        # When every parameter already has a momentum buffer and the decayed
+        # gradients are not needed afterwards, weight decay can be folded into
+        # the momentum update below instead of materializing a decayed copy of
+        # every gradient.
+        fuse_weight_decay = (
+            weight_decay != 0
+            and not maximize
+            and not nesterov
+            and all_states_with_momentum_buffer
+        )
+
+        if weight_decay != 0 and not fuse_weight_decay:
             # Re-use the intermediate memory (device_grads) already allocated for maximize
             if maximize:
                 torch._foreach_add_(device_grads, device_params, alpha=weight_decay)
@@ -402,26 +422,22 @@ def _multi_tensor_sgd(
                 )
 
         if momentum != 0:
-            bufs: List[Tensor] = []
-
-            all_states_with_momentum_buffer = True
-            for i in range(len(device_momentum_buffer_list)):
-                if device_momentum_buffer_list[i] is None:
-                    all_states_with_momentum_buffer = False
-                    break
-                else:
-                    bufs.append(cast(Tensor, device_momentum_buffer_list[i]))
-
             if all_states_with_momentum_buffer:
+                bufs = cast(List[Tensor], device_momentum_buffer_list)
                 torch._foreach_mul_(bufs, momentum)
                 torch._foreach_add_(bufs, device_grads, alpha=1 - dampening)
+                if fuse_weight_decay:
+                    # buf = momentum * buf + (1 - dampening) * (grad + wd * param)
+                    torch._foreach_add_(
+                        bufs, device_params, alpha=weight_decay * (1 - dampening)
+                    )
             else:
                 bufs = []
                 for i in range(len(device_momentum_buffer_list)):
                     if device_momentum_buffer_list[i] is None:
                         buf = device_momentum_buffer_list[i] = momentum_buffer_list[
                             indices[i]
-                        ] = torch.clone(device_grads[i]).detach()
+                        ] = device_grads[i].detach().clone()
                     else:
                         buf = cast(Tensor, device_momentum_buffer_list[i])
                         buf.mul_(momentum).add_(device_grads[i], alpha=1 - dampening)
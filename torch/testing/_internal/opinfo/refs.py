@@ -31,6 +31,15 @@ from torch.testing._internal.opinfo.core import (
 #   by adding kwargs to the constructor.
 
 
+# Maps id(op_db) -> (op_db, {(name, variant_test_name): OpInfo}). Every ref
+# OpInfo performs a parent lookup at import time while the databases hold
+# hundreds of entries, so index each database once instead of scanning it per
+# construction. The database itself is stored alongside the index so its id
+# can't be recycled by a garbage-collected list, and to let lookups verify
+# they got the right database.
+_op_db_index_cache = {}
+
+
 def _find_referenced_opinfo(referenced_name, variant_name, *, op_db=None):
     """
     Finds the OpInfo with the given name that has no variant name.
@@ -41,9 +50,22 @@ def _find_referenced_opinfo(referenced_name, variant_name, *, op_db=None):
     if op_db is None:
         from torch.testing._internal.common_methods_invocations import op_db
 
-    for opinfo in op_db:
-        if opinfo.name == referenced_name and opinfo.variant_test_name == variant_name:
-            return opinfo
+    cached = _op_db_index_cache.get(id(op_db))
+    if cached is None or cached[0] is not op_db:
+        index = {}
+        for opinfo in op_db:
+            # setdefault keeps the first entry, matching the linear scan
+            index.setdefault((opinfo.name, opinfo.variant_test_name), opinfo)
+        _op_db_index_cache[id(op_db)] = (op_db, index)
+    else:
+        index = cached[1]
+    return index.get((referenced_name, variant_name))
+
+
+# Constructor arguments that must not transfer from the parent OpInfo
+_nontransferable_args = frozenset(
+    ("kwargs", "self", "__class__", "skips", "decorators")
+)
 
 
 def _inherit_constructor_args(name, op, inherited, overrides):
@@ -57,21 +79,11 @@ def _inherit_constructor_args(name, op, inherited, overrides):
         "supports_scripting": False,
     }
 
-    # Acquires inherited kwargs
-    kwargs = inherited.copy()
-
-    # Fixes metadata
-    if "kwargs" in kwargs:
-        kwargs.update(kwargs["kwargs"])
-        del kwargs["kwargs"]
-    if "self" in kwargs:
-        del kwargs["self"]
-    if "__class__" in kwargs:
-        del kwargs["__class__"]
-    if "skips" in kwargs:
-        del kwargs["skips"]
-    if "decorators" in kwargs:
-        del kwargs["decorators"]
+    # Acquires inherited kwargs, flattening the nested "kwargs" entry and
+    # dropping non-transferable metadata in a single pass
+    if "kwargs" in inherited:
+        inherited = {**inherited, **inherited["kwargs"]}
+    kwargs = {k: v for k, v in inherited.items() if k not in _nontransferable_args}
 
     # Overrides metadata
     kwargs.update(common_kwargs)
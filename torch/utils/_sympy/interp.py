@@ -10,7 +10,7 @@ of a full handler, see torch.utils._sympy.value_ranges.ValueRangeAnalysis.
 
 import functools
 import logging
-from typing import Any, Dict, Union
+from typing import Any, Dict, Optional, Union
 
 import sympy
 from sympy.logic.boolalg import Boolean as SympyBoolean, BooleanAtom
@@ -187,7 +187,12 @@ def sympy_interp(
     *,
     index_dtype=torch.int64,
     missing_handler=None,
+    memo: Optional[Dict[Union[sympy.Expr, SympyBoolean], Any]] = None,
 ):
+    # memo, if provided, caches the result per distinct subexpression for the
+    # duration of the call, so repeated subterms (common in fused index
+    # expressions) are interpreted once instead of once per occurrence.  Only
+    # pass it for analyses whose handlers are pure.
     # Handle base cases
     dtype = None
     if isinstance(expr, BooleanAtom):
@@ -208,7 +213,9 @@ def sympy_interp(
             raise KeyError(expr)
 
     # Recursive case
-    return _run_sympy_handler(
+    if memo is not None and (r := memo.get(expr, _nil)) is not _nil:
+        return r
+    r = _run_sympy_handler(
         analysis,
         [
             sympy_interp(
@@ -217,9 +224,13 @@ def sympy_interp(
                 arg,
                 index_dtype=index_dtype,
                 missing_handler=missing_handler,
+                memo=memo,
             )
             for arg in expr.args
         ],  # type: ignore[arg-type]
         expr,
         index_dtype=index_dtype,
     )  # type: ignore[arg-type]
+    if memo is not None:
+        memo[expr] = r
+    return r
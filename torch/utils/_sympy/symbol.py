@@ -12,6 +12,7 @@ You can occasionally test if prefixes have been hardcoded by renaming prefixes
 in this file and seeing what breaks.
 """
 
+import functools
 from enum import auto, Enum
 from typing import Iterable, Union
 
@@ -79,10 +80,34 @@ prefix_str = {
     SymT.HALIDE: "h",
 }
 
+# make_symbol/symbol_is_type sit on the hot path of Inductor symbol handling;
+# an attribute read on the (singleton) enum member is cheaper than hashing it
+# into prefix_str on every call.
+for _sym_t, _prefix in prefix_str.items():
+    _sym_t._value_str = _prefix  # type: ignore[attr-defined]
+del _sym_t, _prefix
 
+
+@functools.lru_cache(4096)
 def make_symbol(prefix: SymT, idx: int, **kwargs) -> sympy.Symbol:
     # TODO: maybe put the assumptions here directly
-    return sympy.Symbol(f"{prefix_str[prefix]}{idx}", **kwargs)
+    # Symbols are immutable and sympy interns them by (name, assumptions), so
+    # handing out the cached instance is indistinguishable from reconstruction;
+    # the cache just skips the name build and assumption normalization.
+    return sympy.Symbol(prefix._value_str + str(idx), **kwargs)  # type: ignore[attr-defined]
+
+
+# Callers pass the same handful of prefix combinations over and over; cache
+# the startswith tuples so repeat calls skip the per-element dict probes.
+_prefix_strs: dict = {}
+
+
+def _as_prefix_strs(prefix: Iterable[SymT]) -> tuple:
+    key = tuple(prefix)
+    strs = _prefix_strs.get(key)
+    if strs is None:
+        strs = _prefix_strs[key] = tuple(prefix_str[p] for p in key)
+    return strs
 
 
 # This type is a little wider than it should be, because free_symbols says
@@ -91,10 +116,16 @@ def symbol_is_type(sym: sympy.Basic, prefix: Union[SymT, Iterable[SymT]]) -> boo
     assert isinstance(sym, sympy.Symbol)
     name_str = sym.name.lower()  # Match capitalized names like XBLOCK, RBLOCK
     if isinstance(prefix, SymT):
-        return name_str.startswith(prefix_str[prefix])
+        return name_str.startswith(prefix._value_str)  # type: ignore[attr-defined]
     else:
-        return name_str.startswith(tuple(prefix_str[p] for p in prefix))
+        return name_str.startswith(_as_prefix_strs(prefix))
 
 
 def free_symbol_is_type(e: sympy.Expr, prefix: Union[SymT, Iterable[SymT]]) -> bool:
-    return any(symbol_is_type(v, prefix) for v in e.free_symbols)
+    # Resolve the prefix strings once instead of re-dispatching through
+    # symbol_is_type for every free symbol of the expression.
+    if isinstance(prefix, SymT):
+        strs: Union[str, tuple] = prefix._value_str  # type: ignore[attr-defined]
+    else:
+        strs = _as_prefix_strs(prefix)
+    return any(v.name.lower().startswith(strs) for v in e.free_symbols)
@@ -3,7 +3,6 @@ from __future__ import annotations
 
 import dataclasses
 import functools
-import itertools
 import logging
 import math
 import operator
@@ -59,18 +58,38 @@ class ValueRangeError(RuntimeError):
     pass
 
 
+def _sympify_bool(e):
+    return sympy.true if e else sympy.false
+
+
+def _sympify_float(e):
+    # infinity is special; we use it to bracket integers as well
+    if math.isinf(e):
+        return sympy.oo if e > 0 else -sympy.oo
+    return sympy.Float(e)
+
+
+# Exact-type dispatch for the overwhelmingly common Python scalar inputs;
+# anything else (subclasses, sympy expressions) takes the isinstance ladder.
+_simple_sympify_dispatch = {
+    bool: _sympify_bool,
+    int: sympy.Integer,
+    float: _sympify_float,
+}
+
+
 # Like sympify, but supports less stuff, and also ensures that direct
 # sympy expressions don't have free variables
 def simple_sympify(e):
+    fn = _simple_sympify_dispatch.get(type(e))
+    if fn is not None:
+        return fn(e)
     if isinstance(e, bool):
-        return sympy.true if e else sympy.false
+        return _sympify_bool(e)
     elif isinstance(e, int):
         return sympy.Integer(e)
     elif isinstance(e, float):
-        # infinity is special; we use it to bracket integers as well
-        if math.isinf(e):
-            return sympy.oo if e > 0 else -sympy.oo
-        return sympy.Float(e)
+        return _sympify_float(e)
     elif isinstance(e, sympy.Expr):
         assert e.is_number, e
         # NaNs can occur when doing things like 0 * sympy.oo, but it is better
@@ -85,8 +104,35 @@ def simple_sympify(e):
         raise AssertionError(f"not simple sympy type {type(e)}: {e}")
 
 
+# The concrete number classes that show up as range endpoints; built from
+# representative instances so sympy's specialized singletons (Zero, One, ...)
+# are covered without naming them.
+_le_numeric_types = frozenset(
+    map(
+        type,
+        (
+            sympy.Integer(0),
+            sympy.Integer(1),
+            sympy.Integer(-1),
+            sympy.Integer(2),
+            sympy.Float(0.5),
+            sympy.Rational(1, 3),
+            sympy.oo,
+            -sympy.oo,
+            int_oo,
+            -int_oo,
+        ),
+    )
+)
+
+
 # Sympy atomics only. Unlike <=, it also works on Sympy bools.
 def sympy_generic_le(lower, upper):
+    # This runs in every ValueRanges.__init__ and __contains__, and the
+    # endpoints are numeric in the vast majority of calls; one set probe on
+    # the exact type beats the isinstance walk for those.
+    if type(lower) in _le_numeric_types:
+        return upper >= lower
     if isinstance(lower, sympy.Expr):
         assert isinstance(upper, sympy.Expr)
         # instead of lower <= upper, we do upper >= lower since upper is mostly int_oo
@@ -120,7 +166,6 @@ AllFn = Union[ExprFn, BoolFn]
 AllFn2 = Union[ExprFn2, BoolFn2]
 
 
-@dataclasses.dataclass(frozen=True)
 class ValueRanges(Generic[_T]):
     if TYPE_CHECKING:
         # ruff doesn't understand circular references but mypy does
@@ -137,6 +182,53 @@ class ValueRanges(Generic[_T]):
     is_int: bool
     is_float: bool
 
+    # Millions of short-lived instances are created during range analysis;
+    # slots drop the per-instance __dict__.  Frozen semantics, equality and
+    # hashing are hand-written below to match the frozen dataclass this used
+    # to be.
+    # _hash is lazily filled by __hash__; hashing tuples of sympy objects is
+    # not free and ranges get keyed into caches repeatedly.
+    __slots__ = ("lower", "upper", "is_bool", "is_int", "is_float", "_hash")
+
+    def __setattr__(self, name, value):
+        raise dataclasses.FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name):
+        raise dataclasses.FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if other.__class__ is not ValueRanges:
+            return NotImplemented
+        return (self.lower, self.upper, self.is_bool, self.is_int, self.is_float) == (
+            other.lower,
+            other.upper,
+            other.is_bool,
+            other.is_int,
+            other.is_float,
+        )
+
+    def __hash__(self):
+        # The slot is left unset until first use so construction doesn't pay
+        # for it; sympy caches its own hashes the same way.
+        try:
+            return self._hash
+        except AttributeError:
+            pass
+        h = hash((self.lower, self.upper, self.is_bool, self.is_int, self.is_float))
+        object.__setattr__(self, "_hash", h)
+        return h
+
+    # Slotted instances don't pickle via __dict__, and restoring must bypass
+    # the frozen __setattr__
+    def __getstate__(self):
+        return (self.lower, self.upper, self.is_bool, self.is_int, self.is_float)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
     def __repr__(self) -> str:
         return f"VR[{self.lower}, {self.upper}]"
 
@@ -217,7 +309,7 @@ class ValueRanges(Generic[_T]):
     def boolify(self) -> ValueRanges[SympyBoolean]:
         if vr_is_bool(self):
             return self
-        elif self == ValueRanges.unknown():
+        elif self == _UNKNOWN:
             return ValueRanges.unknown_bool()
         else:
             raise AssertionError(f"not bool like {self}")
@@ -226,7 +318,7 @@ class ValueRanges(Generic[_T]):
         return ValueRanges.wrap(x).issubset(self)
 
     def issubset(self, other):
-        if other is self.unknown_int():
+        if other is _UNKNOWN_INT:
             return True
         return sympy_generic_le(other.lower, self.lower) and sympy_generic_le(
             self.upper, other.upper
@@ -252,20 +344,23 @@ class ValueRanges(Generic[_T]):
         ...
 
     def __and__(self: AllVR, other: AllVR) -> AllVR:
-        if other in (ValueRanges.unknown(), ValueRanges.unknown_int()):
+        if other in _UNKNOWNS:
             return self
-        if self in (ValueRanges.unknown(), ValueRanges.unknown_int()):
+        if self in _UNKNOWNS:
             return other
         assert self.is_bool == other.is_bool, (self, other)
         assert self.is_int == other.is_int, (self, other)
         assert self.is_float == other.is_float, (self, other)
+        # The bounds are constant atoms (see the class comment), so plain
+        # min/max and Python boolean operators pick one of the existing
+        # operands instead of running sympy's Min/Max/And/Or constructors.
         if self.is_bool:
             return ValueRanges(
-                sympy.Or(self.lower, other.lower), sympy.And(self.upper, other.upper)
+                self.lower or other.lower, self.upper and other.upper
             )
         else:
             return ValueRanges(
-                sympy.Max(self.lower, other.lower), sympy.Min(self.upper, other.upper)
+                max(self.lower, other.lower), min(self.upper, other.upper)
             )
 
     # Union
@@ -284,23 +379,40 @@ class ValueRanges(Generic[_T]):
         ...
 
     def __or__(self: AllVR, other: AllVR) -> AllVR:
-        if ValueRanges.unknown() in (self, other):
-            return ValueRanges.unknown()
+        if _UNKNOWN in (self, other):
+            return _UNKNOWN
         assert self.is_bool == other.is_bool, (self, other)
         assert self.is_int == other.is_int, (self, other)
         assert self.is_float == other.is_float, (self, other)
+        # See __and__ for why builtin min/max and boolean operators suffice.
         if self.is_bool:
             return ValueRanges(
-                sympy.And(self.lower, other.lower), sympy.Or(self.upper, other.upper)
+                self.lower and other.lower, self.upper or other.upper
             )
         else:
             return ValueRanges(
-                sympy.Min(self.lower, other.lower), sympy.Max(self.upper, other.upper)
+                min(self.lower, other.lower), max(self.upper, other.upper)
             )
 
     def is_singleton(self) -> bool:
         return self.lower == self.upper
 
+    @classmethod
+    def _unchecked(cls, lower: _T, upper: _T, is_bool: bool, is_int: bool) -> AllVR:
+        """Build a ValueRanges from bounds already known to be valid sympy
+        atoms with lower <= upper, skipping sympify and the bounds check.
+
+        Only for internal fast paths; every invariant checked by __init__ must
+        hold by construction at the call site.
+        """
+        obj = object.__new__(cls)
+        object.__setattr__(obj, "lower", lower)
+        object.__setattr__(obj, "upper", upper)
+        object.__setattr__(obj, "is_bool", is_bool)
+        object.__setattr__(obj, "is_int", is_int)
+        object.__setattr__(obj, "is_float", not is_bool and not is_int)
+        return obj
+
     @staticmethod
     @functools.lru_cache(maxsize=None)
     def unknown() -> ValueRanges[sympy.Expr]:
@@ -331,8 +443,22 @@ class ValueRanges(Generic[_T]):
     def wrap(arg: Union[AllIn, AllVR]) -> AllVR:
         if isinstance(arg, ValueRanges):
             return arg
+        # Singleton ranges over atoms trivially satisfy lower <= upper, so the
+        # sympify/compare work in __init__ can be skipped for the sympy types
+        # this analysis churns through the most.
+        if isinstance(arg, sympy.Integer):
+            return ValueRanges._unchecked(arg, arg, False, True)
+        if isinstance(arg, sympy.Float):
+            return ValueRanges._unchecked(arg, arg, False, False)
+        if isinstance(arg, BooleanAtom):
+            return ValueRanges._unchecked(arg, arg, True, False)
         if isinstance(arg, float) and math.isnan(arg):
             return ValueRanges.unknown()
+        if isinstance(arg, int):  # includes bool
+            # Small constants like 0 and 1 are wrapped over and over (every
+            # `0 in b` divisibility check, say); hand back interned ranges.
+            # Keyed on the class so True does not alias 1.
+            return _wrap_int_singleton(arg.__class__, arg)
         # arg is either ExprIn or BoolIn, but we don't know it here
         return ValueRanges(arg, arg)  # type: ignore[arg-type]
 
@@ -419,12 +545,35 @@ class ValueRanges(Generic[_T]):
     @classmethod
     def coordinatewise_monotone_map(cls, x, y, fn):
         """It's increasing or decreasing on each coordinate."""
+        # Unrolled (no itertools.product, no list): this backs mul/truediv/
+        # floordiv, which run hot enough for the iterator overhead to show.
         x, y = cls.wrap(x), cls.wrap(y)
-        products = [
-            fn(a, b)
-            for a, b in itertools.product([x.lower, x.upper], [y.lower, y.upper])
-        ]
-        return ValueRanges(min(products), max(products))
+        p1 = fn(x.lower, y.lower)
+        p2 = fn(x.lower, y.upper)
+        p3 = fn(x.upper, y.lower)
+        p4 = fn(x.upper, y.upper)
+        return ValueRanges(min(p1, p2, p3, p4), max(p1, p2, p3, p4))
+
+
+# Interned "don't know" ranges.  unknown()/unknown_int() always hand out these
+# exact objects (lru_cache), so hot paths can compare against the globals
+# directly; tuple membership tries identity before falling back to the
+# dataclass equality, which would invoke sympy comparisons on the bounds.
+_UNKNOWN = ValueRanges.unknown()
+_UNKNOWN_INT = ValueRanges.unknown_int()
+_UNKNOWNS = (_UNKNOWN, _UNKNOWN_INT)
+
+# Constant boolean results handed out by the comparison handlers; binding
+# them once saves both the sympy attribute lookups and the range
+# construction on every call.
+_UNKNOWN_BOOL = ValueRanges.unknown_bool()
+_VR_TRUE = ValueRanges.wrap(sympy.true)
+_VR_FALSE = ValueRanges.wrap(sympy.false)
+
+
+@functools.lru_cache(256)
+def _wrap_int_singleton(type_, arg) -> ValueRanges:
+    return ValueRanges(arg, arg)
 
 
 class SymPyValueRangeAnalysis:
@@ -557,11 +706,15 @@ class SymPyValueRangeAnalysis:
     def eq(a, b):
         a = ValueRanges.wrap(a)
         b = ValueRanges.wrap(b)
+        if a is b:
+            # Same range object: equal for sure if it pins down one value,
+            # and the disjointness test below cannot fire either way.
+            return _VR_TRUE if a.is_singleton() else _UNKNOWN_BOOL
         if a.is_singleton() and b.is_singleton() and a.lower == b.lower:
-            return ValueRanges.wrap(sympy.true)
+            return _VR_TRUE
         elif a.lower > b.upper or b.lower > a.upper:  # ranges disjoint
-            return ValueRanges.wrap(sympy.false)
-        return ValueRanges(sympy.false, sympy.true)
+            return _VR_FALSE
+        return _UNKNOWN_BOOL
 
     @classmethod
     def ne(cls, a, b):
@@ -579,11 +732,15 @@ class SymPyValueRangeAnalysis:
         if a.is_bool:
             return cls.and_(cls.not_(a), b)
         else:
+            if a is b:
+                # a.upper < a.lower can't hold, and a.lower >= a.upper holds
+                # exactly for singletons; answer without sympy comparisons.
+                return _VR_FALSE if a.is_singleton() else _UNKNOWN_BOOL
             if a.upper < b.lower:
-                return ValueRanges.wrap(sympy.true)
+                return _VR_TRUE
             elif a.lower >= b.upper:
-                return ValueRanges.wrap(sympy.false)
-            return ValueRanges(sympy.false, sympy.true)
+                return _VR_FALSE
+            return _UNKNOWN_BOOL
 
     @classmethod
     def gt(cls, a, b):
@@ -624,18 +781,38 @@ class SymPyValueRangeAnalysis:
         return ValueRanges.coordinatewise_monotone_map(a, b, _keep_float(safe_mul))
 
     @staticmethod
-    def int_truediv(a, b):
+    def _div_bounds(a, b, op):
+        # Division bounds via sign casework.  Callers guarantee 0 is not in b,
+        # so b has a fixed sign and a/b is monotone in each coordinate; the
+        # signs of a and b determine which two endpoint pairs realize the min
+        # and the max, so we evaluate op twice rather than at all four corners.
+        if b.lower > 0:
+            if a.lower >= 0:
+                lower, upper = op(a.lower, b.upper), op(a.upper, b.lower)
+            elif a.upper <= 0:
+                lower, upper = op(a.lower, b.lower), op(a.upper, b.upper)
+            else:
+                lower, upper = op(a.lower, b.lower), op(a.upper, b.lower)
+        else:
+            if a.lower >= 0:
+                lower, upper = op(a.upper, b.upper), op(a.lower, b.lower)
+            elif a.upper <= 0:
+                lower, upper = op(a.upper, b.lower), op(a.lower, b.upper)
+            else:
+                lower, upper = op(a.upper, b.upper), op(a.lower, b.upper)
+        return ValueRanges(lower, upper)
+
+    @classmethod
+    def int_truediv(cls, a, b):
         a = ValueRanges.wrap(a)
         b = ValueRanges.wrap(b)
         if 0 in b or ((-int_oo in a or int_oo in a) and (-int_oo in b or int_oo in b)):
             return ValueRanges.unknown()
         else:
-            return ValueRanges.coordinatewise_monotone_map(
-                a, b, _keep_float(IntTrueDiv)
-            )
+            return cls._div_bounds(a, b, _keep_float(IntTrueDiv))
 
-    @staticmethod
-    def truediv(a, b):
+    @classmethod
+    def truediv(cls, a, b):
         a = ValueRanges.wrap(a)
         b = ValueRanges.wrap(b)
         if 0 in b or (
@@ -643,25 +820,24 @@ class SymPyValueRangeAnalysis:
         ):
             return ValueRanges.unknown()
         else:
-            return ValueRanges.coordinatewise_monotone_map(
-                a, b, _keep_float(FloatTrueDiv)
-            )
+            return cls._div_bounds(a, b, _keep_float(FloatTrueDiv))
 
-    @staticmethod
-    def floordiv(a, b):
+    @classmethod
+    def floordiv(cls, a, b):
         a = ValueRanges.wrap(a)
         b = ValueRanges.wrap(b)
         if 0 in b:
             return ValueRanges.unknown_int()
-        products = []
-        for x, y in itertools.product([a.lower, a.upper], [b.lower, b.upper]):
+
+        def safe_floordiv(x, y):
             r = FloorDiv(x, y)
             if r is sympy.nan:
-                products.append((sympy.sign(x) * sympy.sign(y)) * int_oo)
-            else:
-                products.append(r)
+                # FloorDiv of two infinities; substitute the signed extreme,
+                # consistent with the monotone extension used for bounds.
+                r = (sympy.sign(x) * sympy.sign(y)) * int_oo
+            return r
 
-        return ValueRanges(min(products), max(products))
+        return cls._div_bounds(a, b, safe_floordiv)
 
     @classmethod
     def mod(cls, x, y):
@@ -780,7 +956,7 @@ class SymPyValueRangeAnalysis:
             a = cls.reciprocal(a)
             b = -b
 
-        if a == ValueRanges.unknown():
+        if a is _UNKNOWN or a == _UNKNOWN:
             return ValueRanges.unknown()
 
         # If the base is positive, then we're good, otherwise nothing's defined
@@ -823,11 +999,12 @@ class SymPyValueRangeAnalysis:
 
     @classmethod
     def minimum(cls, a, b):
-        return cls.min_or_max(a, b, sympy.Min)
+        # builtin min: the bounds are constants, no need for sympy.Min
+        return cls.min_or_max(a, b, min)
 
     @classmethod
     def maximum(cls, a, b):
-        return cls.min_or_max(a, b, sympy.Max)
+        return cls.min_or_max(a, b, max)
 
     @staticmethod
     def min_or_max(a, b, fn):
@@ -906,11 +1083,13 @@ class SymPyValueRangeAnalysis:
         a = a.boolify()
         # We sometimes write unknown without specifying the type correctly
         # In particular, we do that when initialising the bounds for loads in bounds.py
-        assert b.is_bool == c.is_bool or ValueRanges.unknown() in (b, c)
+        assert b.is_bool == c.is_bool or _UNKNOWN in (b, c)
+        # Constant bounds: builtin min/max and boolean operators avoid the
+        # sympy constructors (see ValueRanges.__and__).
         if b.is_bool:
-            return ValueRanges(sympy.And(b.lower, c.lower), sympy.Or(b.upper, c.upper))
+            return ValueRanges(b.lower and c.lower, b.upper or c.upper)
         else:
-            return ValueRanges(sympy.Min(b.lower, c.lower), sympy.Max(b.upper, c.upper))
+            return ValueRanges(min(b.lower, c.lower), max(b.upper, c.upper))
 
     # expr_cond_pair is used to represent a single (expr, condition) pair in piecewise.
     # We just return the value range of the expression and its corresponding condition as a tuple
@@ -927,14 +1106,31 @@ class SymPyValueRangeAnalysis:
     # The ValueRange of Piecewise is just the union of all expr ranges whose condition expr can be True.
     @staticmethod
     def piecewise(*ranges):
+        # Union of the reachable branches, merged in one pass over the
+        # endpoints instead of constructing an intermediate ValueRanges per
+        # `|` for N-way piecewise expressions.
         init_range = None
+        lower = upper = None
         for expr_range, cond_range in ranges:
             if sympy.true in cond_range:
                 if init_range is None:
                     init_range = expr_range
+                    lower, upper = expr_range.lower, expr_range.upper
+                    continue
+                if _UNKNOWN in (init_range, expr_range):
+                    return _UNKNOWN
+                assert init_range.is_bool == expr_range.is_bool
+                if init_range.is_bool:
+                    lower = lower and expr_range.lower
+                    upper = upper or expr_range.upper
                 else:
-                    init_range = init_range | expr_range
-        return init_range
+                    lower = min(lower, expr_range.lower)
+                    upper = max(upper, expr_range.upper)
+        if init_range is None:
+            return None
+        if lower is init_range.lower and upper is init_range.upper:
+            return init_range
+        return ValueRanges(lower, upper)
 
     @staticmethod
     def cos(x):
@@ -1020,7 +1216,7 @@ class ValueRangeAnalysis(SymPyValueRangeAnalysis):
     @staticmethod
     def bool_handler(*args, **kwargs):
         # just assuming bools can have both values
-        return ValueRanges(sympy.false, sympy.true)  # type: ignore[arg-type]
+        return _UNKNOWN_BOOL  # type: ignore[return-value]
 
     @staticmethod
     def default_handler(*args, **kwargs):
@@ -1042,42 +1238,71 @@ class ValueRangeAnalysis(SymPyValueRangeAnalysis):
         assert isinstance(index, ValueRanges)
         return cls.to_dtype(index, dtype)
 
+    # Populated with per-dtype handlers after the class body; to_dtype is
+    # called per op during traversal and the dtype decides the whole branch
+    # structure, so one dict probe replaces the nested dtype checks.
+    _TO_DTYPE: Dict[torch.dtype, Callable] = {}
+
     @staticmethod
-    def to_dtype(x, dtype: torch.dtype, src_dtype: Optional[torch.dtype] = None):
-        x = ValueRanges.wrap(x)
+    def _to_dtype_bool(x):
+        if x.is_singleton():
+            return ValueRanges.wrap(x.lower != 0)
+        elif x.is_bool:
+            return x
+        elif 0 not in x:
+            return _VR_TRUE
+        else:
+            return _UNKNOWN_BOOL
 
-        if dtype == torch.bool:
-            if x.is_singleton():
-                return ValueRanges.wrap(x.lower != 0)
-            elif x.is_bool:
-                return x
-            elif 0 not in x:
-                return ValueRanges.wrap(sympy.true)
-            else:
-                return ValueRanges(sympy.false, sympy.true)
+    @staticmethod
+    def _cast_float(v):
+        if isinstance(v, sympy.Float):
+            return v
+        return sympy.Float(v)
 
-        def cast(x, dtype):
-            # dtype is int or float
-            if dtype.is_floating_point:
-                return sympy.Float(x)
-            else:
-                if x in (int_oo, -int_oo):
-                    return x
-                try:
-                    return sympy.Integer(x)
-                except TypeError:
-                    # inf cannot be cast to Integer
-                    return x
+    @staticmethod
+    def _cast_int(v):
+        if isinstance(v, sympy.Integer) or v in (int_oo, -int_oo):
+            return v
+        try:
+            return sympy.Integer(v)
+        except TypeError:
+            # inf cannot be cast to Integer
+            return v
 
+    @classmethod
+    def _to_dtype_float(cls, x):
         if x.is_bool:
             if x.is_singleton():
-                val = 1 if x.lower else 0
-                return ValueRanges.wrap(cast(val, dtype))
-            else:
-                return ValueRanges(cast(0, dtype), cast(1, dtype))
-        else:
-            # int to float or float to int
-            return ValueRanges(cast(x.lower, dtype), cast(x.upper, dtype))
+                return ValueRanges.wrap(sympy.Float(1 if x.lower else 0))
+            return ValueRanges(sympy.Float(0), sympy.Float(1))
+        # No-op casts are common (e.g. a float range to float64); hand back
+        # the input range instead of re-sympifying both endpoints.
+        if x.is_float:
+            return x
+        return ValueRanges(cls._cast_float(x.lower), cls._cast_float(x.upper))
+
+    @classmethod
+    def _to_dtype_int(cls, x):
+        if x.is_bool:
+            if x.is_singleton():
+                return ValueRanges.wrap(sympy.Integer(1 if x.lower else 0))
+            return ValueRanges(sympy.Integer(0), sympy.Integer(1))
+        if x.is_int:
+            return x
+        return ValueRanges(cls._cast_int(x.lower), cls._cast_int(x.upper))
+
+    @classmethod
+    def to_dtype(cls, x, dtype: torch.dtype, src_dtype: Optional[torch.dtype] = None):
+        x = ValueRanges.wrap(x)
+        handler = cls._TO_DTYPE.get(dtype)
+        if handler is not None:
+            return handler(x)
+        # dtypes not in the table keep the generic behavior: anything
+        # non-floating casts through Integer, as before
+        if dtype.is_floating_point:
+            return cls._to_dtype_float(x)
+        return cls._to_dtype_int(x)
 
     @staticmethod
     def square(x):
@@ -1093,7 +1318,7 @@ class ValueRangeAnalysis(SymPyValueRangeAnalysis):
     @classmethod
     def truncdiv(cls, a, b):
         x = cls.truediv(a, b)
-        if x == ValueRanges.unknown():
+        if x is _UNKNOWN or x == _UNKNOWN:
             return x
 
         return cls.trunc(x)
@@ -1107,6 +1332,19 @@ class ValueRangeAnalysis(SymPyValueRangeAnalysis):
         return self.default_handler
 
 
+ValueRangeAnalysis._TO_DTYPE = {
+    torch.bool: ValueRangeAnalysis._to_dtype_bool,
+    **{
+        dtype: ValueRangeAnalysis._to_dtype_float
+        for dtype in (torch.float16, torch.bfloat16, torch.float32, torch.float64)
+    },
+    **{
+        dtype: ValueRangeAnalysis._to_dtype_int
+        for dtype in (torch.uint8, torch.int8, torch.int16, torch.int32, torch.int64)
+    },
+}
+
+
 def bound_sympy(
     expr: sympy.Expr, ranges: Optional[Dict[sympy.Symbol, ValueRanges]] = None
 ) -> ValueRanges:
@@ -1150,6 +1388,8 @@ def bound_sympy(
             vr = ValueRanges.unknown()
         return vr
 
+    # The range analysis is pure, so repeated subterms of the expression can
+    # share one interpretation via the per-call memo.
     return sympy_interp(
-        SymPyValueRangeAnalysis, ranges, expr, missing_handler=missing_handler
+        SymPyValueRangeAnalysis, ranges, expr, missing_handler=missing_handler, memo={}
     )
@@ -1,5 +1,5 @@
 # mypy: allow-untyped-defs
-from typing import List, Sized, Type, TypeVar
+from typing import List, Optional, Sized, Type, TypeVar
 
 from torch.utils.data.datapipes._decorator import functional_datapipe
 from torch.utils.data.datapipes.datapipe import DataChunk, MapDataPipe
@@ -36,6 +36,7 @@ class BatcherMapDataPipe(MapDataPipe[DataChunk]):
     datapipe: MapDataPipe
     batch_size: int
     drop_last: bool
+    length: Optional[int]
 
     def __init__(
         self,
@@ -50,12 +51,36 @@ class BatcherMapDataPipe(MapDataPipe[DataChunk]):
         self.batch_size = batch_size
         self.drop_last = drop_last
         self.wrapper_class = wrapper_class
+        # Fold the batch count once here; len() on a batcher is called per
+        # sampler iteration and shouldn't redo the isinstance check and
+        # division every time.  Sized pipes may still raise TypeError (e.g. a
+        # batcher over an unsized pipe defines __len__ but can't answer it),
+        # in which case this batcher has no valid length either.
+        self.length = None
+        if isinstance(datapipe, Sized):
+            try:
+                n = len(datapipe)
+            except TypeError:
+                pass
+            else:
+                self.length = (
+                    n // batch_size if drop_last else (n + batch_size - 1) // batch_size
+                )
 
     def __getitem__(self, index) -> DataChunk:
+        start = index * self.batch_size
+        stop = start + self.batch_size
+        if self.length is not None:
+            # Known length: bound the batch upfront and build it with a single
+            # comprehension instead of probing element by element for the
+            # IndexError that marks a short last batch.
+            stop = min(stop, len(self.datapipe))
+            if start >= stop or (self.drop_last and stop - start < self.batch_size):
+                raise IndexError(f"Index {index} is out of bound.")
+            return self.wrapper_class([self.datapipe[i] for i in range(start, stop)])
         batch: List = []
-        indices = range(index * self.batch_size, (index + 1) * self.batch_size)
         try:
-            batch.extend(self.datapipe[i] for i in indices)
+            batch.extend(self.datapipe[i] for i in range(start, stop))
             return self.wrapper_class(batch)
         except IndexError as e:
             if not self.drop_last and len(batch) > 0:
@@ -64,10 +89,6 @@ class BatcherMapDataPipe(MapDataPipe[DataChunk]):
                 raise IndexError(f"Index {index} is out of bound.") from e
 
     def __len__(self) -> int:
-        if isinstance(self.datapipe, Sized):
-            if self.drop_last:
-                return len(self.datapipe) // self.batch_size
-            else:
-                return (len(self.datapipe) + self.batch_size - 1) // self.batch_size
-        else:
+        if self.length is None:
             raise TypeError(f"{type(self).__name__} instance doesn't have valid length")
+        return self.length
@@ -1,24 +1,23 @@
 # mypy: allow-untyped-defs
+import functools
 from typing import Optional
 from tensorboard.compat.proto.node_def_pb2 import NodeDef
-from tensorboard.compat.proto.attr_value_pb2 import AttrValue
 from tensorboard.compat.proto.tensor_shape_pb2 import TensorShapeProto
 
 
-def attr_value_proto(dtype, shape, s):
-    """Create a dict of objects matching a NodeDef's attr field.
+@functools.lru_cache(maxsize=8192)
+def _encode(s: str) -> bytes:
+    # Node names and attribute strings repeat heavily across a graph; cache
+    # the UTF-8 encoding instead of re-encoding per node.
+    return s.encode(encoding="utf_8")
 
-    Follows https://github.com/tensorflow/tensorboard/blob/master/tensorboard/compat/proto/attr_value.proto
-    specifically designed for a NodeDef. The values have been reverse engineered from
-    standard TensorBoard logged data.
-    """
-    attr = {}
-    if s is not None:
-        attr["attr"] = AttrValue(s=s.encode(encoding="utf_8"))
-    if shape is not None:
-        shapeproto = tensor_shape_proto(shape)
-        attr["_output_shapes"] = AttrValue(list=AttrValue.ListValue(shape=[shapeproto]))
-    return attr
+
+@functools.lru_cache(maxsize=4096)
+def _dim_proto(size):
+    # A handful of sizes (notably -1 for unknown) account for most dims in a
+    # graph; protobuf copies messages on extend, so sharing one Dim per size
+    # is safe and skips the per-dim message construction.
+    return TensorShapeProto.Dim(size=size)
 
 
 def tensor_shape_proto(outputsize):
@@ -26,7 +25,9 @@ def tensor_shape_proto(outputsize):
 
     Follows https://github.com/tensorflow/tensorboard/blob/master/tensorboard/compat/proto/tensor_shape.proto .
     """
-    return TensorShapeProto(dim=[TensorShapeProto.Dim(size=d) for d in outputsize])
+    proto = TensorShapeProto()
+    proto.dim.extend(_dim_proto(d) for d in outputsize)
+    return proto
 
 
 def node_proto(
@@ -41,14 +42,17 @@ def node_proto(
     """Create an object matching a NodeDef.
 
     Follows https://github.com/tensorflow/tensorboard/blob/master/tensorboard/compat/proto/node_def.proto .
+    The attr values have been reverse engineered from standard TensorBoard
+    logged data and are written straight into the proto's attr map rather
+    than routed through a throwaway Python dict.
     """
     if input is None:
         input = []
     if not isinstance(input, list):
         input = [input]
-    return NodeDef(
-        name=name.encode(encoding="utf_8"),
-        op=op,
-        input=input,
-        attr=attr_value_proto(dtype, outputsize, attributes),
-    )
+    node = NodeDef(name=_encode(name), op=op, input=input)
+    if attributes is not None:
+        node.attr["attr"].s = _encode(attributes)
+    if outputsize is not None:
+        node.attr["_output_shapes"].list.shape.append(tensor_shape_proto(outputsize))
+    return node